@@ -11,11 +11,17 @@
  See https://github.com/torodean/CARA/blob/main/docs/CARAManual.pdf
 """
 
-from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from types import SimpleNamespace
 import datetime
-# Used for adding application parameters.
-import argparse
+import hashlib
+import io
+import os
+import re
 import subprocess
+import sys
 
 
 class CLIArgs:
@@ -32,12 +38,34 @@ class CLIArgs:
         repo_path (str or None): Path to the target Git repository.
     """
 
+    # (short flag, long flag, takes a value, default, help) for every supported argument.
+    _OPTIONS = (
+        ('-v', '--verbose', False, False,
+         "Enables verbose mode. This will output various program data for detailed output."),
+        ('-d', '--debug', False, False,
+         "Enables debug mode. This will output various program data for debugging."),
+        ('-c', '--config', True, "cara.conf",
+         'The configuration file to use.'),
+        ('-i', '--input', True, None,
+         'The input changelog to use. Use this option to overwrite/update an existing changelog. '
+         'If it was generated by CARA, only commits made since then are read and prepended.'),
+        ('-o', '--output', True, "CHANGELOG.md",
+         'The output file to use. Use this option to create a new changelog.'),
+        ('-r', '--repo', True, ".",
+         'The repo path to use. This will default to the current directory.'),
+    )
+
     def __init__(self):
-        self.parser = argparse.ArgumentParser(
-            description='Changelog Automation & Release Assistant (CARA).'
-        )
-        self.add_arguments()
-        self.args = self.parser.parse_args()
+        self.parser = None
+        self.args = self.parse_simple(sys.argv[1:])
+        if self.args is None:
+            # Only build an argparse parser for --help, errors, or less common argument forms.
+            import argparse
+            self.parser = argparse.ArgumentParser(
+                description='Changelog Automation & Release Assistant (CARA).'
+            )
+            self.add_arguments()
+            self.args = self.parser.parse_args()
 
         self.verbose = self.args.verbose
         self.debug = self.args.debug
@@ -46,60 +74,63 @@ class CLIArgs:
         self.output_file = self.args.output
         self.repo_path = self.args.repo
 
+    def parse_simple(self, argv):
+        """
+        Parses the common argument forms ('-c file', '--verbose', ...) without argparse,
+        which saves its import and setup cost on every run.
+
+        Args:
+            argv (list[str]): The command-line arguments, excluding the program name.
+
+        Returns:
+            types.SimpleNamespace or None: The parsed values, or None if argparse is needed.
+        """
+        flags = {}
+        values = {}
+        for short, long, takes_value, default, _ in self._OPTIONS:
+            dest = long[2:]
+            flags[short] = flags[long] = (dest, takes_value)
+            values[dest] = default
+
+        args = iter(argv)
+        for arg in args:
+            if arg not in flags:
+                return None  # --help, --opt=value, unknown options, ...
+            dest, takes_value = flags[arg]
+            if takes_value:
+                value = next(args, None)
+                if value is None or value.startswith("-"):
+                    return None  # Let argparse report the error.
+                values[dest] = value
+            else:
+                values[dest] = True
+        return SimpleNamespace(**values)
+
     def add_arguments(self):
         """
         Defines and registers all expected command-line arguments.
         """
-        self.parser.add_argument(
-            '-v', '--verbose',
-            action='store_true',
-            default=False,
-            help="Enables verbose mode. This will output various program data for detailed output."
-        )
-        self.parser.add_argument(
-            '-d', '--debug',
-            action='store_true',
-            default=False,
-            help="Enables debug mode. This will output various program data for debugging."
-        )
-        self.parser.add_argument(
-            '-c', '--config',
-            action='store',
-            default="cara.conf",
-            help='The configuration file to use.'
-        )
-        self.parser.add_argument(
-            '-i', '--input',
-            action='store',
-            default=None,
-            help='The input changelog to use. Use this option to overwrite/update an existing changelog.'
-        )
-        self.parser.add_argument(
-            '-o', '--output',
-            action='store',
-            default="CHANGELOG.md",
-            help='The output file to use. Use this option to create a new changelog.'
-        )
-        self.parser.add_argument(
-            '-r', '--repo',
-            action='store',
-            default=".",
-            help='The repo path to use. This will default to the current directory.'
-        )
-        
-        def print_values(self):
-            """
-            Prints the current values of all parsed command-line arguments.
-            """
-            print(f"--------------------------------------")
-            print(f"----- Parse Configuration Values -----")
-            print(f"Verbose Mode: {self.verbose}")
-            print(f"Debug Mode: {self.debug}")
-            print(f"Config File: {self.config}")
-            print(f"Input File: {self.input_file}")
-            print(f"Output File: {self.output_file}")
-            print(f"Repository Path: {self.repo_path}")
-            print(f"--------------------------------------")
+        for short, long, takes_value, default, help_text in self._OPTIONS:
+            self.parser.add_argument(
+                short, long,
+                action='store' if takes_value else 'store_true',
+                default=default,
+                help=help_text
+            )
+
+    def print_values(self):
+        """
+        Prints the current values of all parsed command-line arguments.
+        """
+        print(f"--------------------------------------")
+        print(f"----- Parse Configuration Values -----")
+        print(f"Verbose Mode: {self.verbose}")
+        print(f"Debug Mode: {self.debug}")
+        print(f"Config File: {self.config}")
+        print(f"Input File: {self.input_file}")
+        print(f"Output File: {self.output_file}")
+        print(f"Repository Path: {self.repo_path}")
+        print(f"--------------------------------------")
 
 
 class Config:
@@ -116,15 +147,20 @@ class Config:
         if not file:
             return
 
-        with open(file, "r") as f:
-            for line in f:
-                line = line.split("#", 1)[0].strip()  # Remove comments and whitespace
-                if not line:
-                    continue  # Skip empty lines
-                if delimiter not in line:
-                    continue  # Skip malformed lines
-                key, value = line.split(delimiter, 1)
-                self.config_data[key.strip()] = value.strip()
+        # Newlines are left untranslated; splitlines() handles both LF and CRLF line endings.
+        # utf-8-sig drops the byte order mark some editors (e.g. Notepad) write at the start.
+        with open(file, "r", encoding="utf-8-sig", newline="") as f:
+            data = f.read()
+
+        config_data = self.config_data
+        for raw in data.splitlines():
+            line = raw.partition("#")[0].strip()  # Remove comments and whitespace
+            if not line:
+                continue  # Skip empty lines
+            key, sep, value = line.partition(delimiter)
+            if not sep:
+                continue  # Skip malformed lines
+            config_data[key.strip()] = value.strip()
         
     def get(self, key, default = None):
         return self.config_data.get(key, default)
@@ -155,13 +191,21 @@ class GitLogEntry:
         full_date (str): The commit date containing enough details for parsing the info later.
         display_date (str): The commit date formatted based on the config file for display.
         message (str): The commit message summary.
+        date_parts (tuple): The full_date parsed once into (year, month, day, day name, month name).
     """
-    def __init__(self, commit, author, full_date, display_date, message):
+    # Slots avoid a per-instance __dict__, which matters for repos with many commits.
+    __slots__ = ("commit", "author", "full_date", "display_date", "message", "date_parts")
+
+    def __init__(self, commit, author, full_date, display_date, message, date_parts=None):
         self.commit = commit
         self.author = author
         self.full_date = full_date
         self.display_date = display_date
         self.message = message
+        if date_parts is None:
+            y, m, d, day_name, month_name = full_date.split(",")
+            date_parts = (int(y), int(m), int(d), day_name, month_name)
+        self.date_parts = date_parts
 
     def __repr__(self):
         """
@@ -176,6 +220,146 @@ class GitLogEntry:
         return f"<{self.commit[:7]} - {self.author} - {self.display_date}>"
 
 
+def _iter_records(stream, separator, chunk_size=1 << 16):
+    """
+    Yields the separator-delimited records of a text stream. The stream is read in large
+    chunks which are split in C, rather than iterating over it line by line.
+
+    Args:
+        stream (io.TextIOBase): The stream to read from.
+        separator (str): The record separator, e.g. "\\0".
+        chunk_size (int): The number of characters to read at a time.
+
+    Yields:
+        str: Each non-empty record, without its separator.
+    """
+    pending = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (pending + chunk).split(separator)
+        pending = records.pop()
+        yield from filter(None, records)
+    if pending:
+        yield pending
+
+
+def _find_last_commit(changelog):
+    """
+    Finds the '<!-- cara:last=<sha> -->' marker CARA writes at the top of a changelog.
+
+    Args:
+        changelog (str): The contents of an existing changelog.
+
+    Returns:
+        str or None: The commit the changelog was last generated up to, or None if there is no marker.
+    """
+    # The marker is always written on the first line, so only the start of the file is searched.
+    match = re.search(r"<!-- cara:last=([0-9a-f]+) -->", changelog[:1024])
+    return match.group(1) if match else None
+
+
+def _is_ancestor(repo_path, commit):
+    """
+    Checks whether a commit is part of the history of the repository's HEAD. This is not
+    the case when the commit was rewritten (e.g. by a rebase or squash) or never fetched.
+
+    Args:
+        repo_path (str): Path to the Git repository.
+        commit (str): The commit to look for.
+
+    Returns:
+        bool: True if the commit is HEAD or one of its ancestors.
+    """
+    result = subprocess.run(
+        ["git", "-C", repo_path, "merge-base", "--is-ancestor", commit, "HEAD"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+    )
+    return result.returncode == 0
+
+
+def _has_day_resolution(date_format):
+    """
+    Checks whether a DATE_FORMAT string renders the full calendar date, so that two commits
+    can only share a display date if they were made on the same day.
+
+    Args:
+        date_format (str): A strftime format string, e.g. "%Y-%m-%d".
+
+    Returns:
+        bool: True if the format includes the year and the day of the year, or the year, month and day.
+    """
+    # Optional glibc flags (e.g. "%-d") are skipped; "%%" is a literal percent sign.
+    tokens = set(re.findall(r"%[-_0^#]?(.)", date_format.replace("%%", "")))
+    if tokens & set("FDxcs"):
+        return True  # Composite tokens which include the full date
+    if not tokens & set("Yy"):
+        return False
+    return "j" in tokens or bool(tokens & set("mbBh") and tokens & set("de"))
+
+
+def _split_keywords(value):
+    """
+    Splits a comma-separated keyword configuration value into its non-empty keywords.
+
+    Args:
+        value (str): The raw configuration value, e.g. "fix, feature".
+
+    Returns:
+        list: The stripped keywords, e.g. ["fix", "feature"].
+    """
+    return [kw.strip() for kw in value.split(",") if kw.strip()]
+
+
+def _keyword_pattern(keywords):
+    """
+    Compiles keywords into a single case-insensitive regex alternation, so that a
+    message is scanned once in C rather than once per keyword.
+
+    Args:
+        keywords (list): The keywords to match literally.
+
+    Returns:
+        re.Pattern or None: The compiled pattern, or None if there are no keywords.
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+def _passes_filters(message, min_words, min_chars, exclude_pattern, include_pattern):
+    """
+    Determines if a commit message satisfies all configured filters:
+    minimum word/character count, inclusion, and exclusion keywords.
+
+    Args:
+        message (str): The commit message.
+        min_words (int or None): Minimum number of words required.
+        min_chars (int or None): Minimum number of characters required.
+        exclude_pattern (re.Pattern or None): Matches keywords which reject the message.
+        include_pattern (re.Pattern or None): Matches keywords of which at least one is required.
+
+    Returns:
+        bool: True if the message passes all filters, False otherwise.
+    """
+    if min_words is not None:
+        # Splitting stops once min_words pieces are found, so long messages are not fully split.
+        if len(message.split(None, min_words - 1)) < min_words:
+            return False
+    elif min_chars is not None:
+        if len(message.strip()) < min_chars:
+            return False
+
+    if exclude_pattern is not None and exclude_pattern.search(message):
+        return False
+
+    if include_pattern is not None and not include_pattern.search(message):
+        return False
+
+    return True
+
+
 class GitLog:
     """
     Handles parsing and storing Git log data for a given repository.
@@ -183,13 +367,25 @@ class GitLog:
     Attributes:
         config (Config): The configuration to use for formatting.
         repo_path (str): Path to the Git repository.
+        rev_range (str or None): Revision range to read, e.g. "<sha>..HEAD". Defaults to the full history.
         entries (list): A list of GitLogEntry objects parsed from the Git log.
+        last_commit (str or None): The newest commit read by parse_log, before any filtering.
     """
-    def __init__(self, config=None, repo_path="."):
+    def __init__(self, config=None, repo_path=".", rev_range=None):
     
         self.repo_path = repo_path
-        self.config = config
+        self.config = config if config is not None else Config()  # Defaults for every option
+        self.rev_range = rev_range
         self.entries = []
+        self.last_commit = None
+        # Long-running 'git cat-file --batch' process used by fetch_object, started on first use.
+        self._batch_proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def apply_filters(self):
         """
@@ -203,81 +399,200 @@ class GitLog:
         """
         min_words = self.config.get("MIN_WORDS")
         min_chars = self.config.get("MIN_CHARS")
-        exclude_keywords = self.config.get("EXCLUDE_KEYWORDS", "").lower().split(",")
-        include_keywords = self.config.get("INCLUDE_KEYWORDS", "").lower().split(",")
-
-        def passes(entry):
-            """
-            Determines if a GitLogEntry satisfies all configured filters:
-            minimum word/character count, inclusion, and exclusion keywords.
-
-            Returns:
-                bool: True if the entry passes all filters, False otherwise.
-            """
-            msg = entry.message.lower()
+        min_words = int(min_words) if min_words is not None else None
+        min_chars = int(min_chars) if min_chars is not None else None
+        exclude_pattern = _keyword_pattern(_split_keywords(self.config.get("EXCLUDE_KEYWORDS", "")))
+        include_pattern = _keyword_pattern(_split_keywords(self.config.get("INCLUDE_KEYWORDS", "")))
 
-            if min_words is not None:
-                if len(msg.strip().split()) < int(min_words):
-                    return False
-            elif min_chars is not None:
-                if len(msg.strip()) < int(min_chars):
-                    return False
+        self.entries = [
+            entry for entry in self.entries
+            if _passes_filters(entry.message, min_words, min_chars, exclude_pattern, include_pattern)
+        ]
 
-            if exclude_keywords and any(kw.lower() in msg for kw in exclude_keywords):
-                return False
 
-            if include_keywords and not any(kw.lower() in msg for kw in include_keywords):
-                return False
+    def _iter_log(self, args):
+        """
+        Runs 'git log' with the given extra arguments and parses each commit it reports.
 
-            return True
+        Args:
+            args (list): Additional 'git log' arguments, e.g. filters and a revision range.
 
-        self.entries = [entry for entry in self.entries if passes(entry)]
+        Yields:
+            tuple: (commit, author, full_date, date_parts, display_date, message) for each commit.
 
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error.
+        """
+        format_str = "%H|%an|%ad|%s"
+        # Display dates are derived from the full date, so only one git call is needed.
+        date_format = self.config.get("DATE_FORMAT", "%Y-%m-%d")
+        # -z separates commits with NUL characters rather than newlines.
+        # The time and UTC offset are included so DATE_FORMAT may use any time or timezone token.
+        cmd = ["git", "-C", self.repo_path, "-c", "core.commitGraph=true", "log", "-z",
+               f"--pretty=format:{format_str}", f"--date=format:%Y,%m,%d,%A,%B,%H,%M,%S,%z"] + args
+
+        parsed_days = {}
+        parsed_dates = {}
+
+        # Stream the output so the full log is never held in memory at once.
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=8192) as proc:
+            # git emits UTF-8, so decode it directly instead of going through the locale codec
+            # and universal-newline translation.
+            stream = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace", newline="")
+            for record in _iter_records(stream, "\0"):
+                # Chained partition calls avoid allocating a list of fields for every commit.
+                commit, _, rest = record.partition("|")
+                author, _, rest = rest.partition("|")
+                commit_date, sep, message = rest.partition("|")
+                if not sep:
+                    continue  # Skip records that do not match the expected format
+
+                # Each distinct commit date is parsed and formatted once.
+                parsed_date = parsed_dates.get(commit_date)
+                if parsed_date is None:
+                    full_date, hour, minute, second, offset = commit_date.rsplit(",", 4)
+                    # Commits cluster on the same days, so entries of one day share their date_parts.
+                    date_parts = parsed_days.get(full_date)
+                    if date_parts is None:
+                        y, m, d, day_name, month_name = full_date.split(",")
+                        date_parts = (int(y), int(m), int(d), day_name, month_name)
+                        parsed_days[full_date] = date_parts
+                    sign = -1 if offset.startswith("-") else 1
+                    tz = datetime.timezone(sign * datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])))
+                    commit_time = datetime.datetime(*date_parts[:3], int(hour), int(minute), int(second), tzinfo=tz)
+                    parsed_date = (full_date, date_parts, commit_time.strftime(date_format))
+                    parsed_dates[commit_date] = parsed_date
+                full_date, date_parts, display_date = parsed_date
+
+                yield commit, author, full_date, date_parts, display_date, message
+
+        returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
 
     def parse_log(self):
         """
         Executes 'git log' on the specified repository and parses each commit entry
         into GitLogEntry objects. Entries are stored in the 'entries' list.
 
-        Ignores lines that do not match the expected format.
+        Ignores lines that do not match the expected format. When rev_range only covers
+        the commits added since a previous run, commits duplicating one of the older
+        history are skipped as well, as they already appear in that run's changelog.
+        Unlike a full regeneration, which keeps the newest of the duplicates, this keeps
+        the older commit where it already is in the changelog.
+
+        Returns:
+            bool: True if the log was read, False if git exited with an error.
         """
-        format_str = "%H|%an|%ad|%s"
-        try:
-            date_format = self.config.get("DATE_FORMAT")
-            if (date_format != None):
-                raw_output = subprocess.check_output(
-                    ["git", "-C", self.repo_path, "log", f"--pretty=format:'{format_str}'", f"--date=format:{date_format}"],
-                    universal_newlines=True
-                )
-            else: # default
-                raw_output = subprocess.check_output(
-                    ["git", "-C", self.repo_path, "log", f"--pretty=format:'{format_str}'"],
-                    universal_newlines=True
-                )
-                
-            # This is used for parsing dates later.
-            full_date_output = subprocess.check_output(
-                ["git", "-C", self.repo_path, "log", f"--pretty=format:'{format_str}'", f"--date=format:%Y,%m,%d,%A,%B"],
-                universal_newlines=True
+        filter_args = []
+        # Let git drop commits without any included keyword before they reach Python. Multiple
+        # --grep patterns are OR'ed. git also searches the message body, so this only narrows
+        # the log; apply_filters still performs the exact subject match. git's case folding
+        # only covers ASCII, so non-ASCII keywords are left entirely to apply_filters.
+        include_keywords = _split_keywords(self.config.get("INCLUDE_KEYWORDS", ""))
+        if include_keywords and all(kw.isascii() for kw in include_keywords):
+            filter_args += ["--regexp-ignore-case", "--fixed-strings"] + [f"--grep={kw}" for kw in include_keywords]
+
+        args = list(filter_args)
+        # Bound the history walk when only the most recent commits are wanted.
+        max_commits = self.config.get("MAX_COMMITS")
+        if max_commits is not None:
+            args.append(f"--max-count={int(max_commits)}")
+
+        # A commit-graph file makes git's history traversal considerably faster on large repos.
+        if self.config.get("WRITE_COMMIT_GRAPH", "false").lower() == "true":
+            subprocess.run(
+                ["git", "-C", self.repo_path, "commit-graph", "write", "--reachable", "--changed-paths"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
             )
+
+        # Only read the commits added since a previous run.
+        if self.rev_range:
+            args.append(self.rev_range)
+
+        entries = []
+        last_commit = None
+        # Duplicates (same display date and message) are rejected before an entry is created.
+        seen = set()
+
+        try:
+            for commit, author, full_date, date_parts, display_date, message in self._iter_log(args):
+                if last_commit is None:
+                    last_commit = commit
+
+                key = (display_date, message.strip())
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                entries.append(GitLogEntry(commit, author, full_date, display_date, message, date_parts))
+
+            # Commits which are already in the changelog are read from the older history, so that
+            # new commits duplicating one of them are dropped. When DATE_FORMAT renders the full date,
+            # a duplicate shares its day with a new commit, so the walk stops before the oldest new day. --since is given in UTC because git otherwise uses the local timezone.
+            # A commit's day starts up to 14 hours before the same day in UTC (UTC+14), and the
+            # second day of margin covers commits whose committer date is behind their author date.
+            old_commit, sep, _ = (self.rev_range or "").partition("..")
+            if old_commit and sep and entries:
+                old_args = filter_args + [old_commit]
+                if _has_day_resolution(self.config.get("DATE_FORMAT", "%Y-%m-%d")):
+                    since = datetime.date(*min(entry.date_parts[:3] for entry in entries)) - datetime.timedelta(days=2)
+                    old_args.insert(-1, f"--since={since} 00:00 +0000")
+                old_keys = {
+                    (display_date, message.strip())
+                    for _, _, _, _, display_date, message in self._iter_log(old_args)
+                }
+                # The older copy keeps its place in the changelog, whereas a full regeneration would list
+                # the newest copy instead. The changelog text itself is never rewritten on an update.
+                entries = [entry for entry in entries if (entry.display_date, entry.message.strip()) not in old_keys]
         except subprocess.CalledProcessError:
-            return
+            return False
 
-        lines = raw_output.strip().split("\n")
-        full_dates = full_date_output.strip().split("\n")
-        
-        for idx, line in enumerate(lines):
-            parts = line.split("|", 3)
-            parts_full_date = full_dates[idx].split("|", 3)
-            if len(parts) == 4:
-                commit, author, display_date, message = parts
-                _, _, full_date,_ = parts_full_date
-                
-                # There is an extra ' character at the start and end, the [1:] and [:-1] trims those.
-                self.entries.append(GitLogEntry(commit[1:], author, full_date, display_date, message[:-1]))
-               
-        # Remove duplicate entries.
-        self.entries = self.remove_duplicates_by_day_and_message(self.entries)
+        self.entries.extend(entries)
+        if last_commit is not None:
+            self.last_commit = last_commit
+        return True
+
+    def fetch_object(self, sha):
+        """
+        Returns the raw contents of a Git object, such as a commit, for details that are
+        not part of the parsed log. All lookups are served by a single 'git cat-file --batch'
+        process rather than spawning git once per object.
+
+        Args:
+            sha (str): The name of the object to look up.
+
+        Returns:
+            bytes or None: The object contents, or None if the object could not be found.
+        """
+        if self._batch_proc is None:
+            self._batch_proc = subprocess.Popen(
+                ["git", "-C", self.repo_path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+
+        proc = self._batch_proc
+        proc.stdin.write(f"{sha}\n".encode("utf-8"))
+        proc.stdin.flush()
+
+        # The reply is '<sha> <type> <size>' followed by the contents and a newline, or
+        # '<name> missing' when the object does not exist. A '<rev>:<path>' name may itself
+        # contain spaces, so the header is split from the right.
+        header = proc.stdout.readline().rsplit(None, 2)
+        if len(header) != 3 or header[-1] in (b"missing", b"ambiguous"):
+            return None
+        return proc.stdout.read(int(header[2]) + 1)[:-1]
+
+    def close(self):
+        """
+        Stops the 'git cat-file --batch' process used by fetch_object, if it was started.
+        """
+        if self._batch_proc is None:
+            return
+        self._batch_proc.stdin.close()
+        self._batch_proc.wait()
+        self._batch_proc.stdout.close()
+        self._batch_proc = None
 
     def get_entries(self):
         return self.entries
@@ -313,6 +628,43 @@ class GitLog:
         return unique_entries
 
 
+def _format_line(template, values):
+    """
+    Formats a changelog entry line and makes sure it ends with punctuation.
+
+    Args:
+        template (str): The %-style template of the line.
+        values (tuple or str): The entry fields to substitute into the template.
+
+    Returns:
+        str: The formatted line.
+    """
+    output = (template % values).rstrip()
+    
+    # Check if the output ends with a period, and add one if it doesn't
+    if output[-1] not in ".?!":
+        output += "."
+    
+    return output
+
+
+def _week_key(y, m, d):
+    """
+    Returns the ISO calendar week key of a date, e.g. '2025-W27'.
+    """
+    iso_year, iso_week, _ = datetime.date(y, m, d).isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+# Group key function for each GROUP_BY unit, called with the year, month, and day of a commit.
+_GROUP_KEYS = {
+    "day": lambda y, m, d: f"{y}-{m:02d}-{d:02d}",
+    "week": _week_key,
+    "month": lambda y, m, d: f"{y}-{m:02d}",
+    "year": lambda y, m, d: str(y),
+}
+
+
 class ChangelogGenerator:
     """
     Generates a changelog from a GitLog instance.
@@ -321,80 +673,132 @@ class ChangelogGenerator:
         gitlog (GitLog): The GitLog instance containing parsed Git log entries.
         config (Config): The configuration to use for formatting.
         entries (list): Cached list of GitLogEntry objects from the GitLog.
+        previous (str or None): An existing changelog which the new entries are added to.
         output (list): The output generated.
     """
 
-    def __init__(self, gitlog, config):
+    # The OUTPUT_ENTRIES fields in output order, with their GitLogEntry attribute and template fragment.
+    _FIELD_TEMPLATES = (
+        ("date", "display_date", "[%s] "),
+        ("commit", "commit", "%s: "),
+        ("author", "author", "%s -> "),
+        ("message", "message", "%s"),
+    )
+
+    # The number of entries formatted and joined into each fragment of the output.
+    _BATCH_SIZE = 1024
+
+    def __init__(self, gitlog, config, previous=None):
         """
         Initializes the ChangelogGenerator.
 
         Args:
             gitlog (GitLog): An instance of the GitLog class containing commit entries.
+            config (Config): The configuration to use for formatting.
+            previous (str or None): The contents of an existing changelog to prepend the entries to.
         """
         self.gitlog = gitlog
         self.config = config
         self.entries = gitlog.get_entries()
-        self.full_dates = self.entries[2] # the index of the full_dates field.
+        self.previous = previous
         self.output = []
+
+        # Read all configuration up front so no lookups happen while formatting entries.
+        self._group_by = self.config.get("GROUP_BY", "day").lower()
+
+        # Compile OUTPUT_ENTRIES once into a format template and a getter for the fields it uses.
+        output_entries = set(self.config.get("OUTPUT_ENTRIES", "date commit author message").split())
+        if "all" in output_entries:
+            self._template = "%s: %s -> %s"
+            attrs = ["commit", "author", "message"]
+        else:
+            self._template = "- "
+            attrs = []
+            for field, attr, fragment in self._FIELD_TEMPLATES:
+                if field in output_entries:
+                    self._template += fragment
+                    attrs.append(attr)
+        self._getter = attrgetter(*attrs) if attrs else None
+
+        # Without the date or commit, different commits can produce the same line (e.g. repeated
+        # "Bump version" messages), so formatting is memoized. Otherwise every line is unique
+        # and a cache would only add overhead.
+        if "display_date" in attrs or "commit" in attrs:
+            self._format = _format_line
+        else:
+            self._format = lru_cache(maxsize=8192)(_format_line)
         
     def format_entry(self, entry):
         """
         This will format the entry based on various parameters.
         """
-        output_entries = self.config.get("OUTPUT_ENTRIES").split(" ")
-        output = "- "
-        
-        if (output_entries == "all"):
-            output = f"{entry.commit}: {entry.author} -> {entry.message}"
-        else:
-            if ("date" in output_entries):
-                output += f"[{entry.display_date}] "
-            if ("commit" in output_entries):
-                output += f"{entry.commit}: "
-            if ("author" in output_entries):
-                output += f"{entry.author} -> "
-            if ("message" in output_entries):
-                output += f"{entry.message}"
-        
-        # Check if the output ends with a period, and add one if it doesn't
-        if not output.endswith(".") and not output.endswith("?") and not output.endswith("!"):
-            output += "."
-        
-        return output
+        values = self._getter(entry) if self._getter is not None else ()
+        return self._format(self._template, values)
 
-    def generate(self):
+    def _iter_lines(self):
         """
-        Generates the raw changelog content from the Git log entries.
+        Yields the changelog content piece by piece so it can be streamed to a file
+        without building the whole changelog in memory first.
 
-        Returns:
-            str: A formatted changelog string.
+        Yields:
+            str: Consecutive fragments of the formatted changelog.
         """
-        unit = self.config.get("GROUP_BY", "day").lower()
+        unit = self._group_by
         grouped = self.group_by_time_unit(unit)
+        format_entry = self.format_entry
+
+        # Sections of an existing changelog follow the new ones, without its marker and title.
+        previous_commit = None
+        previous_body = ""
+        if self.previous is not None:
+            previous_commit = _find_last_commit(self.previous)
+            start = self.previous.find("\n## ")
+            if start != -1:
+                previous_body = self.previous[start:]
+
+        # Record the newest commit so the next run only has to read commits added after it.
+        last_commit = self.gitlog.last_commit or previous_commit
+        if last_commit:
+            yield f"<!-- cara:last={last_commit} -->\n"
         
-        output = ["# Changelog\nThis changelog is auto-generated by CARA: https://github.com/torodean/CARA\n"]
-        for key, entries in grouped.items():
+        yield "# Changelog\nThis changelog is auto-generated by CARA: https://github.com/torodean/CARA\n"
+        for index, (key, entries) in enumerate(grouped.items()):
             # Parse the key to extract date components
             if unit == "day":
                 display_date = entries[0].display_date
-                _, _, _, day_name, _ = entries[0].full_date.split(",")
+                day_name = entries[0].date_parts[3]
                 header = f"{display_date}"
                 if day_name not in header:
                     header = f"{display_date} ({day_name})"
             elif unit == "month":
-                _, _, _, _, month_name = entries[0].full_date.split(",")
+                month_name = entries[0].date_parts[4]
                 header = f"{key} ({month_name})"
             else:
                 header = key  # Use key as is for week and year
         
-            output.append(f"## {header}")
-            for entry in entries:
-                line = self.format_entry(entry)
-                output.append(line)
-                
-            output.append("\n") # Add a newline between sections.
+            # Entries are emitted as joined batches rather than one fragment per entry, while large
+            # sections (e.g. a whole year) are never built into one giant string.
+            section = f"\n## {header}\n"
+            for start in range(0, len(entries), self._BATCH_SIZE):
+                batch = "\n".join([format_entry(entry) for entry in entries[start:start + self._BATCH_SIZE]])
+                yield (section if start == 0 else "\n") + batch
+
+            # Merge the oldest new section into the newest existing one when they share a heading.
+            if index == len(grouped) - 1 and previous_body.startswith(section):
+                yield "\n" + previous_body[len(section):]
+                return
+            yield "\n\n" # Add a newline between sections.
 
-        return "\n".join(output)
+        yield previous_body
+
+    def generate(self):
+        """
+        Generates the raw changelog content from the Git log entries.
+
+        Returns:
+            str: A formatted changelog string.
+        """
+        return "".join(self._iter_lines())
 
     def write_to_file(self, path):
         """
@@ -403,9 +807,8 @@ class ChangelogGenerator:
         Args:
             path (str): File path where the changelog should be written.
         """
-        changelog = self.generate()
-        with open(path, "w") as f:
-            f.write(changelog)
+        with open(path, "w", encoding="utf-8", newline="\n", buffering=1 << 16) as f:
+            f.writelines(self._iter_lines())
 
     def group_by_time_unit(self, unit):
         """
@@ -418,46 +821,100 @@ class ChangelogGenerator:
         Returns:
             dict: A dictionary grouped by time unit.
         """
-        valid_units = {"day", "week", "month", "year"}
-        if unit not in valid_units:
-            raise ValueError(f"Invalid grouping unit '{unit}'. Choose from: {', '.join(valid_units)}")
+        if unit not in _GROUP_KEYS:
+            raise ValueError(f"Invalid grouping unit '{unit}'. Choose from: {', '.join(_GROUP_KEYS)}")
 
-        grouped = defaultdict(list)
-        for entry in self.entries:
-            y, m, d, _, _ = entry.full_date.split(",")
-            y, m, d = int(y), int(m), int(d)
-            dt = datetime.date(y, m, d)
+        # Resolve the key function once and memoize it, so each key is computed once per
+        # distinct day rather than once per commit.
+        group_key = lru_cache(maxsize=None)(_GROUP_KEYS[unit])
 
-            if unit == "day":
-                key = dt.isoformat()
-            elif unit == "week":
-                iso_year, iso_week, _ = dt.isocalendar()
-                key = f"{iso_year}-W{iso_week:02d}"
-            elif unit == "month":
-                key = f"{y}-{m:02d}"
-            elif unit == "year":
-                key = str(y)
+        # Sort once by date (descending). Every group key is monotonic in the date, so groupby
+        # then yields each group in one linear pass, already sorted and in descending key order.
+        sorted_entries = sorted(self.entries, key=attrgetter("date_parts"), reverse=True)
 
-            grouped[key].append(entry)
-            
-        # Sort entries within each group by full_date (descending)
-        for key in grouped:
-            grouped[key].sort(key=lambda x: datetime.date(*[int(i) for i in x.full_date.split(",")[:3]]), reverse=True)
-
-        # Sort keys in descending order
-        if unit == "day":
-            sorted_keys = sorted(grouped.keys(), key=lambda x: datetime.date.fromisoformat(x), reverse=True)
-        elif unit == "week":
-            sorted_keys = sorted(grouped.keys(), key=lambda x: datetime.datetime.strptime(x + "-1", "%Y-W%W-%w"), reverse=True)
-        elif unit == "month":
-            sorted_keys = sorted(grouped.keys(), key=lambda x: datetime.datetime.strptime(x, "%Y-%m"), reverse=True)
-        elif unit == "year":
-            sorted_keys = sorted(grouped.keys(), key=int, reverse=True)
-
-        # Create a new dictionary with sorted keys
-        sorted_grouped = {key: grouped[key] for key in sorted_keys}
-        
-        return dict(sorted_grouped)
+        def bucket(entry):
+            y, m, d, _, _ = entry.date_parts
+            return group_key(y, m, d)
+
+        return {key: list(group) for key, group in groupby(sorted_entries, key=bucket)}
+
+
+class ChangelogCache:
+    """
+    Tracks whether a previously generated changelog is still up to date so that
+    CARA can skip regenerating it when nothing has changed.
+
+    The fingerprint combines the repository HEAD, the command-line arguments, the
+    contents of the configuration file and input changelog, and the CARA script itself. It is stored
+    next to the output file in '<output>.cara_cache'.
+
+    Attributes:
+        output_file (str): Path to the changelog this cache belongs to.
+        cache_file (str): Path to the file storing the fingerprint.
+        fingerprint (str or None): Fingerprint of the current inputs, or None if it could not be computed.
+    """
+    def __init__(self, output_file, repo_path=".", config_file=None, args=None, input_file=None):
+        self.output_file = output_file
+        self.cache_file = f"{output_file}.cara_cache"
+        self.fingerprint = self.compute_fingerprint(repo_path, config_file, args, input_file)
+
+    def compute_fingerprint(self, repo_path, config_file, args, input_file=None):
+        """
+        Computes a fingerprint of everything the generated changelog depends on.
+
+        Args:
+            repo_path (str): Path to the Git repository.
+            config_file (str or None): Path to the configuration file.
+            args (dict or None): The parsed command-line arguments.
+            input_file (str or None): Path to the changelog being updated.
+
+        Returns:
+            str or None: A hex digest, or None if the repository HEAD could not be resolved.
+        """
+        try:
+            head = subprocess.check_output(
+                ["git", "-C", repo_path, "rev-parse", "HEAD"],
+                stderr=subprocess.DEVNULL
+            )
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+        digest = hashlib.blake2b(head.strip())
+        digest.update(repr(sorted((args or {}).items())).encode("utf-8"))
+        # An input changelog updated in place is CARA's own output, which is already covered
+        # by the other inputs; hashing it would force one extra regeneration after every run.
+        if input_file and os.path.abspath(input_file) == os.path.abspath(self.output_file):
+            input_file = None
+        # Include CARA itself so an updated script never reuses a stale changelog.
+        for path in (config_file, input_file, __file__):
+            if path and os.path.isfile(path):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        return digest.hexdigest()
+
+    def is_current(self):
+        """
+        Checks whether the output file exists and was generated from the same inputs.
+
+        Returns:
+            bool: True if the changelog does not need to be regenerated.
+        """
+        if self.fingerprint is None or not os.path.isfile(self.output_file):
+            return False
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return f.readline().strip() == self.fingerprint
+        except OSError:
+            return False
+
+    def save(self):
+        """
+        Stores the current fingerprint in the cache file.
+        """
+        if self.fingerprint is None:
+            return
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write(f"{self.fingerprint}\n")
 
 
 
@@ -480,9 +937,32 @@ def main():
     # Load configuration file
     config = Config(cli.config)
 
+    # Skip all work if the changelog was already generated from the same inputs
+    cache = ChangelogCache(cli.output_file, cli.repo_path, cli.config, vars(cli.args), cli.input_file)
+    if cache.is_current():
+        if cli.verbose:
+            print(f"{cli.output_file} is up to date.")
+        return
+
+    # When updating an existing changelog, only read the commits added since it was generated
+    previous = None
+    rev_range = None
+    if cli.input_file and os.path.isfile(cli.input_file):
+        with open(cli.input_file, "r", encoding="utf-8") as f:
+            previous = f.read()
+        last_commit = _find_last_commit(previous)
+        if last_commit and _is_ancestor(cli.repo_path, last_commit):
+            rev_range = f"{last_commit}..HEAD"
+        else:
+            previous = None  # Not generated by CARA or from a rewritten history, so regenerate the full changelog
+
     # Parse git log
-    gitlog = GitLog(config, repo_path=cli.repo_path)
-    gitlog.parse_log()
+    gitlog = GitLog(config, repo_path=cli.repo_path, rev_range=rev_range)
+    if not gitlog.parse_log() and rev_range:
+        # Reading only the new commits failed, so regenerate the full changelog instead
+        previous = None
+        gitlog = GitLog(config, repo_path=cli.repo_path)
+        gitlog.parse_log()
     gitlog.apply_filters()
 
     # Display log entries if verbose mode is enabled
@@ -495,8 +975,9 @@ def main():
             print(entry)
 
     # Generate the changelog
-    generator = ChangelogGenerator(gitlog, config)
+    generator = ChangelogGenerator(gitlog, config, previous)
     generator.write_to_file(cli.output_file)
+    cache.save()
 
 
 
@@ -1 +1,123 @@
+#!/bin/python3
+"""
+ test_cara.py
+ Created by: Antonius Torode
+ Description: This file tests running CARA end to end on throwaway Git repositories.
+"""
+import os
+import subprocess
+import sys
 
+sys.path.append('../')
+
+from cara import main
+
+
+def commit(repo, message, date="2024-08-12T10:00:00+00:00"):
+    """
+    Helper to create an empty commit with a fixed date in a throwaway repository.
+    """
+    env = dict(os.environ, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=Author", "-c", "user.email=author@example.com",
+         "commit", "-q", "--allow-empty", "-m", message],
+        check=True, env=env
+    )
+    return subprocess.check_output(["git", "-C", str(repo), "rev-parse", "HEAD"], text=True).strip()
+
+
+def run_main(monkeypatch, tmp_path, repo, output, input_file=None, config_text="OUTPUT_ENTRIES = message\n"):
+    """
+    Helper to run CARA's main() on a repository, by default with a message-only configuration.
+    """
+    config = tmp_path / "cara.conf"
+    config.write_text(config_text)
+    argv = ["cara.py", "-c", str(config), "-r", str(repo), "-o", str(output)]
+    if input_file:
+        argv += ["-i", str(input_file)]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    return output.read_text(encoding="utf-8")
+
+
+def test_update_with_stale_marker_regenerates(tmp_path, monkeypatch):
+    """
+    Test that an update whose marker names a commit missing from the history (e.g. after a
+    rebase) regenerates the full changelog instead of keeping the stale one.
+    """
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    head = commit(repo, "Add the first feature")
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(f"<!-- cara:last={'0' * 40} -->\n# Changelog\n\n## 2000-01-01 (Saturday)\n- Rewritten commit\n")
+
+    text = run_main(monkeypatch, tmp_path, repo, changelog, changelog)
+
+    assert text.startswith(f"<!-- cara:last={head} -->\n")
+    assert "- Add the first feature" in text
+    assert "Rewritten commit" not in text
+
+
+def test_update_keeps_existing_duplicate_in_place(tmp_path, monkeypatch):
+    """
+    Test that an update leaves out a new commit repeating a same-day entry already in the
+    changelog, keeping the older commit where it is listed, even when it is not the last
+    entry of its section. A full regeneration lists the newest commit instead.
+    """
+    config_text = "OUTPUT_ENTRIES = commit message\n"
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    fix = commit(repo, "Fix a typo", "2024-08-12T09:00:00+00:00")
+    old_docs = commit(repo, "Update the documentation", "2024-08-12T10:00:00+00:00")
+    changelog = tmp_path / "CHANGELOG.md"
+    run_main(monkeypatch, tmp_path, repo, changelog, config_text=config_text)
+
+    new_docs = commit(repo, "Update the documentation", "2024-08-12T11:00:00+00:00")
+    feature = commit(repo, "Add a feature", "2024-08-12T12:00:00+00:00")
+    updated = run_main(monkeypatch, tmp_path, repo, changelog, changelog, config_text)
+    full = run_main(monkeypatch, tmp_path, repo, tmp_path / "FULL.md", config_text=config_text)
+
+    section = updated[updated.index("## 2024-08-12 (Monday)\n"):].rstrip().splitlines()[1:]
+    assert section == [
+        f"- {feature}: Add a feature.",
+        f"- {old_docs}: Update the documentation.",
+        f"- {fix}: Fix a typo.",
+    ]
+    assert f"- {new_docs}: Update the documentation." in full
+    assert updated.startswith(f"<!-- cara:last={feature} -->\n")
+
+
+def test_update_drops_duplicate_across_timezones(tmp_path, monkeypatch):
+    """
+    Test that an update finds a same-day duplicate made in UTC+14 while CARA runs in UTC-12.
+    """
+    monkeypatch.setenv("TZ", "Etc/GMT+12")
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    commit(repo, "Bump version", "2024-01-15T00:30:00+14:00")
+    changelog = tmp_path / "CHANGELOG.md"
+    run_main(monkeypatch, tmp_path, repo, changelog)
+
+    commit(repo, "Bump version", "2024-01-15T23:00:00+14:00")
+    updated = run_main(monkeypatch, tmp_path, repo, changelog, changelog)
+
+    assert updated.count("- Bump version") == 1
+
+
+def test_update_drops_duplicate_with_coarse_date_format(tmp_path, monkeypatch):
+    """
+    Test that an update finds a duplicate made weeks earlier when DATE_FORMAT only renders the month.
+    """
+    config_text = "DATE_FORMAT = %B %Y\nGROUP_BY = month\nOUTPUT_ENTRIES = message\n"
+    repo = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    commit(repo, "Bump version", "2024-01-05T10:00:00+00:00")
+    changelog = tmp_path / "CHANGELOG.md"
+    run_main(monkeypatch, tmp_path, repo, changelog, config_text=config_text)
+
+    commit(repo, "Bump version", "2024-01-20T10:00:00+00:00")
+    commit(repo, "Add a feature", "2024-01-21T10:00:00+00:00")
+    updated = run_main(monkeypatch, tmp_path, repo, changelog, changelog, config_text)
+
+    assert updated.count("- Bump version") == 1
+    assert "- Add a feature" in updated
@@ -0,0 +1,102 @@
+#!/bin/python3
+"""
+ test_changelog_cache.py
+ Created by: Antonius Torode
+ Description: This file tests the ChangelogCache class of CARA.
+"""
+import sys
+import subprocess
+from unittest.mock import patch
+import pytest
+
+sys.path.append('../')
+
+from cara import ChangelogCache
+
+
+def make_cache(tmp_path, head=b"abc1234567890\n", args=None, config_text="GROUP_BY = day\n"):
+    """
+    Helper to create a ChangelogCache for an output file in tmp_path with a mocked HEAD.
+    """
+    config_file = tmp_path / "cara.conf"
+    config_file.write_text(config_text)
+    with patch("subprocess.check_output", return_value=head):
+        return ChangelogCache(str(tmp_path / "CHANGELOG.md"), ".", str(config_file), args or {"output": "CHANGELOG.md"})
+
+
+def test_not_current_without_output(tmp_path):
+    """
+    Test that is_current() is False when no changelog has been written yet.
+    """
+    cache = make_cache(tmp_path)
+    cache.save()
+    assert cache.is_current() is False
+
+
+def test_current_after_save(tmp_path):
+    """
+    Test that is_current() is True once the fingerprint is saved for an existing output.
+    """
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n")
+    cache = make_cache(tmp_path)
+    assert cache.is_current() is False
+    cache.save()
+    assert cache.is_current() is True
+
+
+@pytest.mark.parametrize("changes", [
+    {"head": b"def9876543210\n"},
+    {"args": {"output": "OTHER.md"}},
+    {"config_text": "GROUP_BY = week\n"},
+])
+def test_changed_inputs_invalidate_cache(tmp_path, changes):
+    """
+    Test that a new HEAD, different arguments, or an edited config invalidate the cache.
+    """
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n")
+    make_cache(tmp_path).save()
+    assert make_cache(tmp_path, **changes).is_current() is False
+
+
+def test_git_failure_disables_cache(tmp_path):
+    """
+    Test that the cache is never considered current when HEAD cannot be resolved.
+    """
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n")
+    error = subprocess.CalledProcessError(128, "git")
+    with patch("subprocess.check_output", side_effect=error):
+        cache = ChangelogCache(str(tmp_path / "CHANGELOG.md"))
+    assert cache.fingerprint is None
+    cache.save()
+    assert cache.is_current() is False
+
+
+def test_changed_input_file_invalidates_cache(tmp_path):
+    """
+    Test that replacing the --input changelog invalidates the cache of a different output file.
+    """
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n")
+    input_file = tmp_path / "PREVIOUS.md"
+    input_file.write_text("<!-- cara:last=abc1234567890 -->\n# Changelog\n")
+
+    def cache_for_input():
+        with patch("subprocess.check_output", return_value=b"abc1234567890\n"):
+            return ChangelogCache(str(tmp_path / "CHANGELOG.md"), ".", None, {}, str(input_file))
+
+    cache_for_input().save()
+    assert cache_for_input().is_current() is True
+    input_file.write_text("<!-- cara:last=def9876543210 -->\n# Changelog\n")
+    assert cache_for_input().is_current() is False
+
+
+def test_input_file_updated_in_place_stays_current(tmp_path):
+    """
+    Test that updating the output changelog in place does not invalidate its own cache.
+    """
+    output_file = tmp_path / "CHANGELOG.md"
+    output_file.write_text("# Changelog\n")
+    with patch("subprocess.check_output", return_value=b"abc1234567890\n"):
+        ChangelogCache(str(output_file), ".", None, {}, str(output_file)).save()
+    output_file.write_text("# Changelog\n- New entry\n")
+    with patch("subprocess.check_output", return_value=b"abc1234567890\n"):
+        assert ChangelogCache(str(output_file), ".", None, {}, str(output_file)).is_current() is True
@@ -30,8 +30,9 @@ class DummyGitLog:
     """
     A dummy GitLog to simulate entries for ChangelogGenerator tests.
     """
-    def __init__(self, entries):
+    def __init__(self, entries, last_commit=None):
         self._entries = entries
+        self.last_commit = last_commit
 
     def get_entries(self):
         return self._entries
@@ -65,6 +66,38 @@ def test_format_entry_partial(fields, expected):
     assert formatted.startswith(expected)
 
 
+def test_format_entry_message_with_percent():
+    """
+    Test that format_entry does not interpret format characters inside commit messages.
+    """
+    config = DummyConfig({"OUTPUT_ENTRIES": "author message"})
+    entry = GitLogEntry("abc1234", "Alice", "2024,08,12,Monday,August", "2024-08-12", "Reach 100% coverage %s")
+    gen = ChangelogGenerator(DummyGitLog([entry]), config)
+    assert gen.format_entry(entry) == "- Alice -> Reach 100% coverage %s."
+
+
+@pytest.mark.parametrize("fields, memoized", [
+    ("message", True),
+    ("author message", True),
+    ("date message", False),
+    ("commit message", False),
+    ("all", False),
+])
+def test_format_entry_memoized_only_for_repeatable_lines(fields, memoized):
+    """
+    Test that format_entry caches lines only when different commits can produce the same line.
+    """
+    config = DummyConfig({"OUTPUT_ENTRIES": fields})
+    first = GitLogEntry("abc1234", "Alice", "2024,08,12,Monday,August", "2024-08-12", "Bump version")
+    second = GitLogEntry("def5678", "Alice", "2024,08,13,Tuesday,August", "2024-08-13", "Bump version")
+    gen = ChangelogGenerator(DummyGitLog([first, second]), config)
+    assert gen.format_entry(first).endswith("Bump version.")
+    assert gen.format_entry(second).endswith("Bump version.")
+    assert hasattr(gen._format, "cache_info") is memoized
+    if memoized:
+        assert gen._format.cache_info().hits == 1
+
+
 @pytest.mark.parametrize("unit,key_format", [
     ("day", "%Y-%m-%d"),
     ("week", "%Y-W%W"),
@@ -118,3 +151,60 @@ def test_write_to_file(tmp_path):
     assert file_path.exists()
     content = file_path.read_text()
     assert "Commit message" in content
+
+
+def test_generate_writes_last_commit_marker():
+    """
+    Test that generate records the newest commit in a marker on the first line.
+    """
+    entry = GitLogEntry("abc1234", "Alice", "2024,08,12,Monday,August", "2024-08-12", "Commit message")
+    config = DummyConfig({"GROUP_BY": "day", "OUTPUT_ENTRIES": "message"})
+    gen = ChangelogGenerator(DummyGitLog([entry], last_commit="abc1234"), config)
+    assert gen.generate().startswith("<!-- cara:last=abc1234 -->\n# Changelog")
+
+
+def test_generate_prepends_to_previous_changelog():
+    """
+    Test that new entries are prepended to an existing changelog, merging a shared section.
+    """
+    config = DummyConfig({"GROUP_BY": "day", "OUTPUT_ENTRIES": "message"})
+    old_entries = [
+        GitLogEntry("aaa1111", "Alice", "2024,08,12,Monday,August", "2024-08-12", "Old same day"),
+        GitLogEntry("bbb2222", "Alice", "2024,08,11,Sunday,August", "2024-08-11", "Older day"),
+    ]
+    previous = ChangelogGenerator(DummyGitLog(old_entries, last_commit="aaa1111"), config).generate()
+
+    new_entries = [
+        GitLogEntry("ccc3333", "Bob", "2024,08,13,Tuesday,August", "2024-08-13", "Next day"),
+        GitLogEntry("ddd4444", "Bob", "2024,08,12,Monday,August", "2024-08-12", "New same day"),
+    ]
+    gen = ChangelogGenerator(DummyGitLog(new_entries, last_commit="ccc3333"), config, previous)
+    full = ChangelogGenerator(DummyGitLog(new_entries + old_entries, last_commit="ccc3333"), config)
+
+    assert gen.generate() == full.generate()
+    assert gen.generate().count("## 2024-08-12 (Monday)") == 1
+
+
+def test_generate_without_new_commits_keeps_previous():
+    """
+    Test that an update without new commits reproduces the existing changelog.
+    """
+    config = DummyConfig({"GROUP_BY": "day", "OUTPUT_ENTRIES": "message"})
+    entry = GitLogEntry("abc1234", "Alice", "2024,08,12,Monday,August", "2024-08-12", "Commit message")
+    previous = ChangelogGenerator(DummyGitLog([entry], last_commit="abc1234"), config).generate()
+    gen = ChangelogGenerator(DummyGitLog([]), config, previous)
+    assert gen.generate() == previous
+
+
+def test_generate_large_section_in_batches():
+    """
+    Test that sections larger than one output batch are written completely and in order.
+    """
+    entries = [
+        GitLogEntry(f"{i:07d}", "Alice", "2024,08,12,Monday,August", "2024-08-12", f"Commit {i}")
+        for i in range(2 * ChangelogGenerator._BATCH_SIZE + 5)
+    ]
+    config = DummyConfig({"GROUP_BY": "year", "OUTPUT_ENTRIES": "message"})
+    output = ChangelogGenerator(DummyGitLog(entries), config).generate()
+    lines = output.split("## 2024\n", 1)[1].rstrip("\n").split("\n")
+    assert lines == [f"- Commit {i}." for i in range(len(entries))]
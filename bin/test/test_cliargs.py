@@ -91,3 +91,45 @@ def test_defaults_when_some_args_omitted():
     assert cli.input_file == "in.md"
     assert cli.output_file == "CHANGELOG.md"  # default
     assert cli.repo_path == "."  # default
+
+
+def test_print_values(capsys):
+    """
+    Test that print_values() is a CLIArgs method and prints the parsed values.
+    """
+    cli = run_cli_with_args(["--output", "out.md"])
+    cli.print_values()
+    captured = capsys.readouterr()
+    assert "Output File: out.md" in captured.out
+    assert "Repository Path: ." in captured.out
+
+
+def test_common_arguments_skip_argparse():
+    """
+    Test that the common argument forms are parsed without building an argparse parser.
+    """
+    cli = run_cli_with_args(["-v", "-c", "cfg.conf", "--output", "out.md"])
+    assert cli.parser is None
+    assert cli.verbose is True
+    assert cli.config == "cfg.conf"
+    assert cli.output_file == "out.md"
+
+
+def test_equals_form_falls_back_to_argparse():
+    """
+    Test that argument forms the simple parser does not handle are parsed by argparse.
+    """
+    cli = run_cli_with_args(["--config=cfg.conf", "-vd"])
+    assert cli.parser is not None
+    assert cli.config == "cfg.conf"
+    assert cli.verbose is True
+    assert cli.debug is True
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--unknown"], ["--config"]])
+def test_help_and_errors_use_argparse(args):
+    """
+    Test that help output and invalid arguments are still handled by argparse.
+    """
+    with pytest.raises(SystemExit):
+        run_cli_with_args(args)
@@ -55,6 +55,38 @@ KEY2=VALUE2 # inline comment
     assert config.get("KEY3") is None
 
 
+def test_crlf_line_endings():
+    """
+    Test that configuration files with Windows line endings are loaded without stray carriage returns.
+    """
+    cfg_path = create_temp_config("KEY1=VALUE1\r\nKEY2 = VALUE2 # comment\r\nKEY3=\r\n")
+    config = Config(cfg_path)
+    assert config.get("KEY1") == "VALUE1"
+    assert config.get("KEY2") == "VALUE2"
+    assert config.get("KEY3") == ""
+
+
+def test_utf8_values():
+    """
+    Test that non-ASCII configuration values are read as UTF-8.
+    """
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmp:
+        tmp.write("TITLE=Änderungsprotokoll\n".encode("utf-8"))
+    config = Config(tmp.name)
+    assert config.get("TITLE") == "Änderungsprotokoll"
+
+
+def test_utf8_bom_skipped():
+    """
+    Test that a UTF-8 byte order mark does not become part of the first key.
+    """
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmp:
+        tmp.write("DATE_FORMAT=%d.%m.%Y\r\nTITLE=Änderungsprotokoll\r\n".encode("utf-8-sig"))
+    config = Config(tmp.name)
+    assert config.get("DATE_FORMAT") == "%d.%m.%Y"
+    assert config.get("TITLE") == "Änderungsprotokoll"
+
+
 def test_malformed_lines_skipped():
     """
     Test that malformed lines without the delimiter are skipped.
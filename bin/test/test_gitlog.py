@@ -4,13 +4,15 @@
  Created by: Antonius Torode
  Description: This file tests the GitLog and GitLogEntry classes of CARA.
 """
+import io
+import subprocess
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pytest
 
 sys.path.append('../')
 
-from cara import GitLog, GitLogEntry, Config
+from cara import GitLog, GitLogEntry, Config, _find_last_commit, _has_day_resolution, _is_ancestor, _iter_records
 
 def make_entry(commit="abc1234567890", author="Author", full_date="2025,08,12,Tuesday,August",
                display_date="2025-08-12", message="Test commit message"):
@@ -20,6 +22,17 @@ def make_entry(commit="abc1234567890", author="Author", full_date="2025,08,12,Tu
     return GitLogEntry(commit, author, full_date, display_date, message)
 
 
+def make_process(lines, returncode=0):
+    """
+    Helper to create a mocked subprocess.Popen instance streaming the given NUL-separated records.
+    """
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.BytesIO("\0".join(lines).encode("utf-8"))
+    proc.wait.return_value = returncode
+    return proc
+
+
 def test_gitlogentry_repr():
     """
     Test that GitLogEntry __repr__ returns the expected short format.
@@ -28,6 +41,16 @@ def test_gitlogentry_repr():
     assert repr(entry) == "<abc1234 - Author - 2025-08-12>"
 
 
+def test_gitlogentry_has_no_instance_dict():
+    """
+    Test that GitLogEntry uses __slots__ rather than a per-instance __dict__.
+    """
+    entry = make_entry()
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.unknown = "value"
+
+
 def test_apply_filters_min_words():
     """
     Test that apply_filters() filters out entries with fewer words than MIN_WORDS.
@@ -76,8 +99,36 @@ def test_apply_filters_include_keywords():
     assert all("feature" in e.message.lower() for e in log.entries)
 
 
-@patch("subprocess.check_output")
-def test_parse_log(mock_check_output):
+def test_apply_filters_keywords_are_literal_and_case_insensitive():
+    """
+    Test that keyword filters match case-insensitively and treat regex characters literally.
+    """
+    config = Config()
+    config.set("EXCLUDE_KEYWORDS", "WIP, c++")
+    log = GitLog(config)
+    log.entries = [
+        make_entry(message="wip: half done"),
+        make_entry(message="Port parser to C++"),
+        make_entry(message="Port parser to cxx"),
+    ]
+    log.apply_filters()
+    assert [e.message for e in log.entries] == ["Port parser to cxx"]
+
+
+def test_apply_filters_without_keywords_keeps_entries():
+    """
+    Test that apply_filters() keeps every entry when no keyword filters are configured.
+    """
+    config = Config()
+    config.set("MIN_WORDS", "2")
+    log = GitLog(config)
+    log.entries = [make_entry(message="one two"), make_entry(message="one two three")]
+    log.apply_filters()
+    assert len(log.entries) == 2
+
+
+@patch("subprocess.Popen")
+def test_parse_log(mock_popen):
     """
     Test that parse_log() populates entries correctly from mocked git log output.
     """
@@ -85,25 +136,369 @@ def test_parse_log(mock_check_output):
     log = GitLog(config, repo_path=".")
 
     raw_lines = [
-        "'abc1234567890|Author|2025-08-12|Commit message 1'",
-        "'def9876543210|Author|2025-08-13|Commit message 2'"
-    ]
-    full_date_lines = [
-        "'abc1234567890|Author|2025,08,12,Tuesday,August|Commit message 1'",
-        "'def9876543210|Author|2025,08,13,Wednesday,August|Commit message 2'"
+        "abc1234567890|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Commit message 1",
+        "malformed line without fields",
+        "def9876543210|Author|2025,08,13,Wednesday,August,09,37,00,+0000|Commit message 2 | with a pipe"
     ]
 
-    mock_check_output.side_effect = [
-        "\n".join(raw_lines),
-        "\n".join(full_date_lines)
-    ]
+    mock_popen.return_value = make_process(raw_lines)
 
     log.parse_log()
 
     assert len(log.entries) == 2
     assert log.entries[0].commit == "abc1234567890"
     assert log.entries[0].full_date == "2025,08,12,Tuesday,August"
+    assert log.entries[0].date_parts == (2025, 8, 12, "Tuesday", "August")
+    assert log.entries[0].display_date == "2025-08-12"
     assert log.entries[0].message == "Commit message 1"
+    assert log.entries[1].message == "Commit message 2 | with a pipe"
+    assert mock_popen.call_count == 1
+
+
+@patch("subprocess.Popen")
+def test_parse_log_skips_duplicates(mock_popen):
+    """
+    Test that parse_log() drops commits with the same day and message as an earlier one.
+    """
+    log = GitLog(Config(), repo_path=".")
+    mock_popen.return_value = make_process([
+        "abc1234567890|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Same message",
+        "def9876543210|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Same message",
+        "0123456789abc|Author|2025,08,13,Wednesday,August,09,37,00,+0000|Same message"
+    ])
+
+    log.parse_log()
+
+    assert [e.commit for e in log.entries] == ["abc1234567890", "0123456789abc"]
+
+
+@patch("subprocess.Popen")
+def test_parse_log_decodes_utf8(mock_popen):
+    """
+    Test that parse_log() decodes non-ASCII authors and messages as UTF-8.
+    """
+    log = GitLog(Config(), repo_path=".")
+    mock_popen.return_value = make_process([
+        "abc1234567890|Zoë Müller|2025,08,12,Tuesday,August,09,37,00,+0000|Füge Übersetzungen hinzu"
+    ])
+
+    log.parse_log()
+
+    assert log.entries[0].author == "Zoë Müller"
+    assert log.entries[0].message == "Füge Übersetzungen hinzu"
+
+
+@patch("subprocess.Popen")
+def test_parse_log_parses_each_date_once(mock_popen):
+    """
+    Test that parse_log() reuses the parsed date of commits made on the same day.
+    """
+    config = Config()
+    config.set("DATE_FORMAT", "%d.%m.%Y")
+    log = GitLog(config, repo_path=".")
+    mock_popen.return_value = make_process([
+        "abc1234567890|Author|2025,08,12,Tuesday,August,09,37,00,+0000|First message",
+        "def9876543210|Author|2025,08,12,Tuesday,August,14,05,12,+0200|Second message"
+    ])
+
+    log.parse_log()
+
+    assert [e.display_date for e in log.entries] == ["12.08.2025", "12.08.2025"]
+    assert log.entries[0].date_parts is log.entries[1].date_parts
+
+
+@patch("subprocess.Popen")
+def test_parse_log_date_format_with_time(mock_popen):
+    """
+    Test that parse_log() renders time and timezone tokens of DATE_FORMAT like git does,
+    and keeps same-day commits with the same message when their times differ.
+    """
+    config = Config()
+    config.set("DATE_FORMAT", "%a %Y-%m-%d at %H:%M %z")
+    log = GitLog(config, repo_path=".")
+    mock_popen.return_value = make_process([
+        "abc1234567890|Author|2025,07,01,Tuesday,July,09,37,00,+0000|Same message",
+        "def9876543210|Author|2025,07,01,Tuesday,July,14,30,59,-0230|Same message"
+    ])
+
+    log.parse_log()
+
+    assert "--date=format:%Y,%m,%d,%A,%B,%H,%M,%S,%z" in mock_popen.call_args[0][0]
+    assert [e.display_date for e in log.entries] == [
+        "Tue 2025-07-01 at 09:37 +0000",
+        "Tue 2025-07-01 at 14:30 -0230"
+    ]
+    assert log.entries[0].full_date == "2025,07,01,Tuesday,July"
+
+
+@patch("subprocess.Popen")
+def test_parse_log_without_config(mock_popen):
+    """
+    Test that a GitLog created without a configuration parses and filters using defaults.
+    """
+    log = GitLog()
+    mock_popen.return_value = make_process([
+        "abc1234567890|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Commit message 1"
+    ])
+
+    log.parse_log()
+    log.apply_filters()
+
+    assert len(log.entries) == 1
+    assert log.entries[0].display_date == "2025-08-12"
+
+
+@patch("subprocess.Popen")
+def test_parse_log_git_failure(mock_popen):
+    """
+    Test that parse_log() leaves entries empty when git exits with an error.
+    """
+    log = GitLog(Config(), repo_path="/not/a/repo")
+    mock_popen.return_value = make_process([], returncode=128)
+
+    assert log.parse_log() is False
+    assert log.entries == []
+
+
+@patch("subprocess.Popen")
+def test_parse_log_include_keywords_passed_to_git(mock_popen):
+    """
+    Test that parse_log() forwards INCLUDE_KEYWORDS to git log as --grep patterns.
+    """
+    config = Config()
+    config.set("INCLUDE_KEYWORDS", "feature, fix,")
+    log = GitLog(config, repo_path=".")
+    mock_popen.return_value = make_process([])
+
+    log.parse_log()
+
+    cmd = mock_popen.call_args[0][0]
+    assert "--grep=feature" in cmd
+    assert "--grep=fix" in cmd
+    assert "--grep=" not in cmd
+    assert "--fixed-strings" in cmd
+
+
+@patch("subprocess.Popen")
+def test_parse_log_non_ascii_include_keywords_not_passed_to_git(mock_popen):
+    """
+    Test that parse_log() leaves non-ASCII INCLUDE_KEYWORDS to apply_filters, since git
+    does not fold their case, and that matching commits are still kept.
+    """
+    config = Config()
+    config.set("INCLUDE_KEYWORDS", "fix, ÜBERSETZUNG")
+    log = GitLog(config, repo_path=".")
+    mock_popen.return_value = make_process([
+        "abc1234567890|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Füge übersetzung hinzu"
+    ])
+
+    log.parse_log()
+    log.apply_filters()
+
+    cmd = mock_popen.call_args[0][0]
+    assert not any(arg.startswith("--grep") for arg in cmd)
+    assert "--regexp-ignore-case" not in cmd
+    assert [e.message for e in log.entries] == ["Füge übersetzung hinzu"]
+
+
+@patch("subprocess.run")
+@patch("subprocess.Popen")
+def test_parse_log_max_commits_and_commit_graph(mock_popen, mock_run):
+    """
+    Test that parse_log() honors MAX_COMMITS and writes a commit-graph when WRITE_COMMIT_GRAPH is true.
+    """
+    config = Config()
+    config.set("MAX_COMMITS", "50")
+    config.set("WRITE_COMMIT_GRAPH", "True")
+    log = GitLog(config, repo_path=".")
+    mock_popen.return_value = make_process([])
+
+    log.parse_log()
+
+    assert "--max-count=50" in mock_popen.call_args[0][0]
+    assert mock_run.call_count == 1
+    assert "commit-graph" in mock_run.call_args[0][0]
+
+
+@patch("subprocess.run")
+@patch("subprocess.Popen")
+def test_parse_log_defaults_walk_full_history(mock_popen, mock_run):
+    """
+    Test that parse_log() neither caps the log nor writes a commit-graph by default.
+    """
+    log = GitLog(Config(), repo_path=".")
+    mock_popen.return_value = make_process([])
+
+    log.parse_log()
+
+    assert not any(arg.startswith("--max-count") for arg in mock_popen.call_args[0][0])
+    mock_run.assert_not_called()
+
+
+@patch("subprocess.Popen")
+def test_fetch_object_reuses_batch_process(mock_popen):
+    """
+    Test that fetch_object() serves several lookups from one 'git cat-file --batch' process.
+    """
+    proc = MagicMock()
+    proc.stdout = io.BytesIO(
+        b"abc1234567890 commit 5\nfirst\n"
+        b"def9876543210 commit 6\nsecond\n"
+        b"0000000 missing\n"
+        b"HEAD:a b c.md missing\n"
+    )
+    mock_popen.return_value = proc
+
+    with GitLog(Config(), repo_path=".") as log:
+        assert log.fetch_object("abc1234567890") == b"first"
+        assert log.fetch_object("def9876543210") == b"second"
+        assert log.fetch_object("0000000") is None
+        assert log.fetch_object("HEAD:a b c.md") is None
+
+    assert mock_popen.call_count == 1
+    assert "--batch" in mock_popen.call_args[0][0]
+    proc.stdin.close.assert_called_once()
+    assert log._batch_proc is None
+
+
+def test_fetch_object_from_repository(tmp_path):
+    """
+    Test that fetch_object() returns raw objects from a real repository, including
+    '<rev>:<path>' names containing spaces, and None for missing ones.
+    """
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=Author", "-c", "user.email=author@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    (tmp_path / "release notes.md").write_text("Notes\n")
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "Add release notes"], check=True)
+    sha = subprocess.check_output(git + ["rev-parse", "HEAD"], text=True).strip()
+
+    with GitLog(Config(), repo_path=str(tmp_path)) as log:
+        assert log.fetch_object(sha).startswith(b"tree ")
+        assert log.fetch_object("HEAD:release notes.md") == b"Notes\n"
+        assert log.fetch_object("HEAD:no such file.md") is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_records(chunk_size):
+    """
+    Test that _iter_records() splits a stream on the separator regardless of chunk boundaries.
+    """
+    stream = io.StringIO("first\0second record\nwith a newline\0\0last")
+    records = list(_iter_records(stream, "\0", chunk_size))
+    assert records == ["first", "second record\nwith a newline", "last"]
+
+
+@patch("subprocess.Popen")
+def test_parse_log_rev_range_and_last_commit(mock_popen):
+    """
+    Test that parse_log() reads only the given revision range and records the newest commit.
+    """
+    config = Config()
+    config.set("MIN_WORDS", "10")
+    log = GitLog(config, repo_path=".", rev_range="abc1234567890..HEAD")
+    mock_popen.side_effect = [
+        make_process([
+            "def9876543210|Author|2025,08,13,Wednesday,August,09,37,00,+0000|Short",
+            "0123456789abc|Author|2025,08,12,Tuesday,August,09,37,00,+0000|Also short"
+        ]),
+        make_process([])
+    ]
+
+    log.parse_log()
+    log.apply_filters()
+
+    assert mock_popen.call_args_list[0][0][0][-1] == "abc1234567890..HEAD"
+    assert log.entries == []
+    assert log.last_commit == "def9876543210"
+
+
+@patch("subprocess.Popen")
+def test_parse_log_rev_range_skips_commits_of_older_history(mock_popen):
+    """
+    Test that parse_log() drops new commits duplicating a commit of the older history,
+    reading that history only from the day before the oldest new commit.
+    """
+    log = GitLog(Config(), repo_path=".", rev_range="abc1234567890..HEAD")
+    mock_popen.side_effect = [
+        make_process([
+            "def9876543210|Author|2025,08,13,Wednesday,August,09,37,00,+0000|Same message",
+            "0123456789abc|Author|2025,08,13,Wednesday,August,08,00,00,+0000|Fresh message"
+        ]),
+        make_process([
+            "abc1234567890|Author|2025,08,13,Wednesday,August,07,00,00,+0000|Same message",
+            "fedcba9876543|Author|2025,08,12,Tuesday,August,07,00,00,+0000|Fresh message"
+        ])
+    ]
+
+    assert log.parse_log() is True
+
+    assert [e.message for e in log.entries] == ["Fresh message"]
+    assert log.last_commit == "def9876543210"
+    old_cmd = mock_popen.call_args_list[1][0][0]
+    assert old_cmd[-2:] == ["--since=2025-08-11 00:00 +0000", "abc1234567890"]
+
+
+@patch("subprocess.Popen")
+def test_parse_log_rev_range_reads_whole_older_history_for_coarse_dates(mock_popen):
+    """
+    Test that parse_log() does not bound the older history when DATE_FORMAT is coarser than a day.
+    """
+    config = Config()
+    config.set("DATE_FORMAT", "%B %Y")
+    log = GitLog(config, repo_path=".", rev_range="abc1234567890..HEAD")
+    mock_popen.side_effect = [
+        make_process(["def9876543210|Author|2025,08,20,Wednesday,August,09,37,00,+0000|Bump version"]),
+        make_process(["abc1234567890|Author|2025,08,05,Tuesday,August,09,37,00,+0000|Bump version"])
+    ]
+
+    log.parse_log()
+
+    assert log.entries == []
+    old_cmd = mock_popen.call_args_list[1][0][0]
+    assert old_cmd[-1] == "abc1234567890"
+    assert not any(arg.startswith("--since") for arg in old_cmd)
+
+
+@pytest.mark.parametrize("date_format, expected", [
+    ("%Y-%m-%d", True),
+    ("%a %Y-%m-%d at %H:%M %z", True),
+    ("%-d.%-m.%y", True),
+    ("%Y, day %j", True),
+    ("%F", True),
+    ("%B %Y", False),
+    ("%A", False),
+    ("%m-%d", False),
+    ("%Y-%m-%%d", False),
+])
+def test_has_day_resolution(date_format, expected):
+    """
+    Test that _has_day_resolution() only accepts formats rendering the full calendar date.
+    """
+    assert _has_day_resolution(date_format) is expected
+
+
+def test_find_last_commit():
+    """
+    Test that _find_last_commit() reads the marker at the top of a changelog.
+    """
+    assert _find_last_commit("<!-- cara:last=abc123 -->\n# Changelog\n") == "abc123"
+    assert _find_last_commit("# Changelog\n") is None
+    assert _find_last_commit("# Changelog\n" + "x" * 2048 + "<!-- cara:last=abc123 -->") is None
+
+
+def test_is_ancestor(tmp_path):
+    """
+    Test that _is_ancestor() accepts commits of the HEAD history and rejects unknown ones.
+    """
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=Author", "-c", "user.email=author@example.com"]
+    subprocess.run(git + ["init", "-q"], check=True)
+    subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "First commit"], check=True)
+    first = subprocess.check_output(git + ["rev-parse", "HEAD"], text=True).strip()
+    subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "Second commit"], check=True)
+
+    assert _is_ancestor(str(tmp_path), first) is True
+    assert _is_ancestor(str(tmp_path), "0" * 40) is False
 
 
 def test_remove_duplicates_by_day_and_message():